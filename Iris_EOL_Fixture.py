@@ -5,6 +5,7 @@ from devices.PressureSensor_PQ3834 import PressureSensorPQ3834
 from devices.FlowPressure_SD9500 import FlowPressureSensorSD9500
 from devices.FlowSensor_SD6020 import FlowSensorSD6020
 import atexit
+import queue
 import threading
 import tkinter as tk
 
@@ -96,6 +97,9 @@ def open_monitor():
 
     window = tk.Tk()
     window.title("Sensor Monitor")
+    # Keep the window unmapped while the rows are built so Tk lays it out
+    # once instead of after every widget.
+    window.withdraw()
 
     # Resize the window to approximately one fifth of the screen dimensions.
     screen_width = window.winfo_screenwidth()
@@ -104,160 +108,108 @@ def open_monitor():
     height = max(200, screen_height // 5)
     window.geometry(f"{width}x{height}")
 
+    # One entry per displayed value: (label, placeholder text).
+    rows = [(f"LC{i + 1}", "--- N") for i in range(len(cells))]
+    rows += [("PS", "--- PSI"), ("VF", "--- CFM"), ("VP", "--- PSI"), ("PF", "--- CFM")]
+
     # Configure grid so that each row uses equal height. Individual frames will
     # manage the two column layout internally to maintain the 2:1 width ratio
     # between sensor names and values.
     window.columnconfigure(0, weight=1)
-    for i in range(len(cells) + 4):
+    for i in range(len(rows)):
         window.rowconfigure(i, weight=1)
 
     font = ("TkDefaultFont", 16)
 
-    value_vars = []
-    stop_events = []
-
-    for i in range(len(cells)):
-        # Create a frame for each load cell row to draw a visible border
+    def add_row(row, name, placeholder):
+        # Each row gets its own frame so it draws a visible border
         row_frame = tk.Frame(window, bd=1, relief="solid")
-        row_frame.grid(row=i, column=0, sticky="nsew", padx=5, pady=5)
+        row_frame.grid(row=row, column=0, sticky="nsew", padx=5, pady=5)
         row_frame.columnconfigure(0, weight=2)
         row_frame.columnconfigure(1, weight=1)
 
-        name_label = tk.Label(row_frame, text=f"LC{i + 1}", font=font, anchor="center")
+        name_label = tk.Label(row_frame, text=name, font=font, anchor="center")
         name_label.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
 
-        var = tk.StringVar(value="--- N")
+        var = tk.StringVar(value=placeholder)
         value_label = tk.Label(row_frame, textvariable=var, font=font, anchor="center")
         value_label.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-        value_vars.append(var)
-
-        stop_event = threading.Event()
-        stop_events.append(stop_event)
+        return var
 
-        def make_callback(idx):
-            def _update(force):
-                if force is None:
-                    value_vars[idx].set("N/A")
-                else:
-                    value_vars[idx].set(f"{force:.2f} N")
-            return _update
-
-        thread = threading.Thread(
-            target=cells[i].monitor_force,
-            kwargs={"callback": make_callback(i), "stop_event": stop_event},
-            daemon=True,
-        )
-        thread.start()
+    value_vars = [add_row(i, name, placeholder) for i, (name, placeholder) in enumerate(rows)]
+    lc_vars = value_vars[:len(cells)]
+    ps_var, vf_var, vp_var, pf_var = value_vars[len(cells):]
 
-    # Add pressure sensor row with a frame and thread
-    pressure_frame = tk.Frame(window, bd=1, relief="solid")
-    pressure_frame.grid(row=len(cells), column=0, sticky="nsew", padx=5, pady=5)
-    pressure_frame.columnconfigure(0, weight=2)
-    pressure_frame.columnconfigure(1, weight=1)
+    # Monitor threads post (StringVar, text) pairs here instead of touching
+    # Tk directly; the main loop drains the queue once per tick.
+    updates = queue.Queue()
 
-    pressure_name = tk.Label(pressure_frame, text="PS", font=font, anchor="center")
-    pressure_name.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+    def post(var, value, unit):
+        updates.put((var, "N/A" if value is None else f"{value:.2f} {unit}"))
 
-    pressure_var = tk.StringVar(value="--- PSI")
-    pressure_value = tk.Label(pressure_frame, textvariable=pressure_var, font=font, anchor="center")
-    pressure_value.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-
-    pressure_stop = threading.Event()
-    stop_events.append(pressure_stop)
+    def make_force_callback(var):
+        def _update(force):
+            post(var, force, "N")
+        return _update
 
     def pressure_callback(value):
-        if value is None:
-            pressure_var.set("N/A")
-        else:
-            pressure_var.set(f"{value:.2f} PSI")
-
-    pressure_thread = threading.Thread(
-        target=pressure_sensor.monitor_pressure,
-        kwargs={"callback": pressure_callback, "stop_event": pressure_stop},
-        daemon=True,
-    )
-    pressure_thread.start()
-
-    # Add SD9500 flow and pressure rows with a single thread updating both
-    flow_frame = tk.Frame(window, bd=1, relief="solid")
-    flow_frame.grid(row=len(cells) + 1, column=0, sticky="nsew", padx=5, pady=5)
-    flow_frame.columnconfigure(0, weight=2)
-    flow_frame.columnconfigure(1, weight=1)
-
-    flow_name = tk.Label(flow_frame, text="VF", font=font, anchor="center")
-    flow_name.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-
-    flow_var = tk.StringVar(value="--- CFM")
-    flow_value = tk.Label(flow_frame, textvariable=flow_var, font=font, anchor="center")
-    flow_value.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-
-    sd_pressure_frame = tk.Frame(window, bd=1, relief="solid")
-    sd_pressure_frame.grid(row=len(cells) + 2, column=0, sticky="nsew", padx=5, pady=5)
-    sd_pressure_frame.columnconfigure(0, weight=2)
-    sd_pressure_frame.columnconfigure(1, weight=1)
-
-    sd_pressure_name = tk.Label(sd_pressure_frame, text="VP", font=font, anchor="center")
-    sd_pressure_name.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-
-    sd_pressure_var = tk.StringVar(value="--- PSI")
-    sd_pressure_value = tk.Label(sd_pressure_frame, textvariable=sd_pressure_var, font=font, anchor="center")
-    sd_pressure_value.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-
-    sd_stop = threading.Event()
-    stop_events.append(sd_stop)
+        post(ps_var, value, "PSI")
 
     def sd_callback(flow, pressure):
-        if flow is None:
-            flow_var.set("N/A")
-        else:
-            flow_var.set(f"{flow:.2f} CFM")
-        if pressure is None:
-            sd_pressure_var.set("N/A")
-        else:
-            sd_pressure_var.set(f"{pressure:.2f} PSI")
-
-    sd_thread = threading.Thread(
-        target=sd9500_sensor.monitor,
-        kwargs={"callback": sd_callback, "stop_event": sd_stop},
-        daemon=True,
-    )
-    sd_thread.start()
-
-    # Add SD6020 flow row with its own thread
-    pf_frame = tk.Frame(window, bd=1, relief="solid")
-    pf_frame.grid(row=len(cells) + 3, column=0, sticky="nsew", padx=5, pady=5)
-    pf_frame.columnconfigure(0, weight=2)
-    pf_frame.columnconfigure(1, weight=1)
-
-    pf_name = tk.Label(pf_frame, text="PF", font=font, anchor="center")
-    pf_name.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-
-    pf_var = tk.StringVar(value="--- CFM")
-    pf_value = tk.Label(pf_frame, textvariable=pf_var, font=font, anchor="center")
-    pf_value.grid(row=0, column=1, sticky="nsew", padx=5, pady=5)
-
-    pf_stop = threading.Event()
-    stop_events.append(pf_stop)
+        post(vf_var, flow, "CFM")
+        post(vp_var, pressure, "PSI")
 
     def pf_callback(flow):
-        if flow is None:
-            pf_var.set("N/A")
-        else:
-            pf_var.set(f"{flow:.2f} CFM")
-
-    pf_thread = threading.Thread(
-        target=sd6020_sensor.monitor,
-        kwargs={"callback": pf_callback, "stop_event": pf_stop},
-        daemon=True,
-    )
-    pf_thread.start()
+        post(pf_var, flow, "CFM")
+
+    # (monitor method, callback) for every sensor, each run on its own thread
+    monitors = [
+        (cell.monitor_force, make_force_callback(var)) for cell, var in zip(cells, lc_vars)
+    ]
+    monitors += [
+        (pressure_sensor.monitor_pressure, pressure_callback),
+        (sd9500_sensor.monitor, sd_callback),
+        (sd6020_sensor.monitor, pf_callback),
+    ]
+
+    stop_events = []
+    for target, callback in monitors:
+        stop_event = threading.Event()
+        stop_events.append(stop_event)
+        thread = threading.Thread(
+            target=target,
+            kwargs={"callback": callback, "stop_event": stop_event},
+            daemon=True,
+        )
+        thread.start()
+
+    poll_id = None
+
+    def poll_updates():
+        nonlocal poll_id
+        # Drain everything queued since the last tick and keep only the
+        # newest text per label, so each label is set at most once.
+        latest = {}
+        try:
+            while True:
+                var, text = updates.get_nowait()
+                latest[str(var)] = (var, text)
+        except queue.Empty:
+            pass
+        for var, text in latest.values():
+            var.set(text)
+        poll_id = window.after(100, poll_updates)
 
     def on_close():
         for ev in stop_events:
             ev.set()
+        if poll_id is not None:
+            window.after_cancel(poll_id)
         window.destroy()
 
     window.protocol("WM_DELETE_WINDOW", on_close)
+    poll_updates()
+    window.deiconify()
     window.mainloop()
 
     if __name__ == "__main__":
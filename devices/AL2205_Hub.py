@@ -1,6 +1,20 @@
 class AL2205Hub:
     """Interface to an AL2205 IO-Link hub connected to an AL1342."""
 
+    # Per the AL2205 documentation, the first two words following the
+    # base register contain hub‑level diagnostics.  Actual channel data for
+    # X1.0 begins at offset 3 and subsequent channels increment by one.
+    word_map = {
+        0: 3,
+        1: 4,
+        2: 5,
+        3: 6,
+        4: 7,
+        5: 8,
+        6: 9,
+        7: 10,
+    }
+
     def __init__(self, io_master, port_number):
         """Initialize the interface.
 
@@ -29,20 +43,7 @@ class AL2205Hub:
         count : int, optional
             Number of consecutive registers to read starting at the index.
         """
-        # Per the AL2205 documentation, the first two words following the
-        # base register contain hub‑level diagnostics.  Actual channel data for
-        # X1.0 begins at offset 3 and subsequent channels increment by one.
-        word_map = {
-            0: 3,
-            1: 4,
-            2: 5,
-            3: 6,
-            4: 7,
-            5: 8,
-            6: 9,
-            7: 10,
-        }
-        word_offset = word_map.get(x1_index)
+        word_offset = self.word_map.get(x1_index)
         if word_offset is None:
             raise ValueError("Invalid X1 index. Must be between 0 and 7.")
 
@@ -1,5 +1,8 @@
 import time, struct
 
+# Precompiled big-endian PDIN field decoders
+_INT16_BE = struct.Struct(">h")
+
 class FlowPressureSensorSD9500:
     """SD9500 over IO-Link on an IFM AL1342 (reads flow in CFM, pressure in PSI)."""
 
@@ -74,40 +77,44 @@ class FlowPressureSensorSD9500:
         regs = self.io.read_holding(self.pdin_reg, nregs)
         if not regs:
             raise ConnectionError("PDIN read failed")
-        out = bytearray()
-        for r in regs:
-            hi, lo = (r >> 8) & 0xFF, r & 0xFF
-            out.extend((lo, hi) if self.byte_swap else (hi, lo))
-        return bytes(out[:self.pdlen_bytes])
+        # Pack all registers in one call; little-endian words swap the bytes.
+        order = "<" if self.byte_swap else ">"
+        return struct.pack(f"{order}{len(regs)}H", *regs)[:self.pdlen_bytes]
+
+    def _flow_from_pd(self, pd: bytes):
+        if len(pd) < 6:
+            return None
+        return _INT16_BE.unpack_from(pd, 4)[0] * self._FLOW_CNT_TO_CFM
+
+    def _pressure_from_pd(self, pd: bytes):
+        if len(pd) < 14:
+            return None
+        return _INT16_BE.unpack_from(pd, 12)[0] * self._PRES_CNT_TO_PSI
 
     # ---- public API (same names you used) ----
     def readVF(self):
         """Volumetric flow in CFM (PD bytes 4..5; Int16, 0.1 m^3/h per count)."""
-        pd = self._read_pdin_bytes()
-        if len(pd) < 6:
-            return None
-        flow_raw = struct.unpack(">h", pd[4:6])[0]
-        return flow_raw * self._FLOW_CNT_TO_CFM
+        return self._flow_from_pd(self._read_pdin_bytes())
 
     def readVP(self):
         """Pressure in PSI (PD bytes 12..13; Int16, 0.01 bar per count)."""
+        return self._pressure_from_pd(self._read_pdin_bytes())
+
+    def read_flow_pressure(self):
+        """Return ``(flow_cfm, pressure_psi)`` decoded from a single PDIN read."""
         pd = self._read_pdin_bytes()
-        if len(pd) < 14:
-            return None
-        pres_raw = struct.unpack(">h", pd[12:14])[0]
-        return pres_raw * self._PRES_CNT_TO_PSI
+        return self._flow_from_pd(pd), self._pressure_from_pd(pd)
 
     def monitor(self, duration=None, callback=None, stop_event=None, interval=0.5, debug=False):
         start = time.time()
         try:
             while True:
                 try:
-                    flow = self.readVF()
-                    pressure = self.readVP()
+                    flow, pressure = self.read_flow_pressure()
                     if debug:
                         pd = self._read_pdin_bytes()
-                        flow_raw = struct.unpack(">h", pd[4:6])[0] if len(pd) >= 6 else None
-                        pres_raw = struct.unpack(">h", pd[12:14])[0] if len(pd) >= 14 else None
+                        flow_raw = _INT16_BE.unpack_from(pd, 4)[0] if len(pd) >= 6 else None
+                        pres_raw = _INT16_BE.unpack_from(pd, 12)[0] if len(pd) >= 14 else None
                         pqi = self._read_pqi()
                         print(f"[PQI=0x{pqi:02X} len={len(pd)} swap={self.byte_swap}] "
                               f"raw(flow={flow_raw}, pres={pres_raw})")
@@ -127,6 +134,11 @@ class FlowPressureSensorSD9500:
                     break
                 if duration and (time.time() - start) >= duration:
                     break
-                time.sleep(interval)
+                if stop_event:
+                    # Wake as soon as the caller asks us to stop.
+                    if stop_event.wait(interval):
+                        break
+                else:
+                    time.sleep(interval)
         except KeyboardInterrupt:
             pass
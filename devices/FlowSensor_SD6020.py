@@ -1,5 +1,9 @@
 import time, struct
 
+# Precompiled big-endian PDIN field decoders
+_INT16_BE = struct.Struct(">h")
+_FLOAT32_BE = struct.Struct(">f")
+
 class FlowSensorSD6020:
     """
     SD6020 over IO-Link on an IFM AL1342 (defaults to Port X03).
@@ -78,11 +82,9 @@ class FlowSensorSD6020:
         regs = self.io.read_holding(self.pdin_reg, nregs)
         if not regs:
             raise ConnectionError(f"PDIN read failed (X0{self.port_number})")
-        out = bytearray()
-        for r in regs:
-            hi, lo = (r >> 8) & 0xFF, r & 0xFF
-            out.extend((lo, hi) if self.byte_swap else (hi, lo))
-        return bytes(out[:self.pdlen_bytes])
+        # Pack all registers in one call; little-endian words swap the bytes.
+        order = "<" if self.byte_swap else ">"
+        return struct.pack(f"{order}{len(regs)}H", *regs)[:self.pdlen_bytes]
 
     # ---------- public API ----------
     def readPF(self):
@@ -90,7 +92,7 @@ class FlowSensorSD6020:
         pd = self._read_pdin_bytes()
         if len(pd) < 6:
             return None
-        flow_raw = struct.unpack(">h", pd[4:6])[0]
+        flow_raw = _INT16_BE.unpack_from(pd, 4)[0]
         return flow_raw * self._FLOW_CNT_TO_CFM
 
     # Optional helpers (handy for validation / debugging)
@@ -98,22 +100,22 @@ class FlowSensorSD6020:
         pd = self._read_pdin_bytes()
         if len(pd) < 8:
             return None
-        t_raw = struct.unpack(">h", pd[6:8])[0]
+        t_raw = _INT16_BE.unpack_from(pd, 6)[0]
         return t_raw * 0.01
 
     def read_totaliser_m3(self):
         pd = self._read_pdin_bytes()
         if len(pd) < 4:
             return None
-        return struct.unpack(">f", pd[0:4])[0]
+        return _FLOAT32_BE.unpack_from(pd, 0)[0]
 
     def read_raw(self):
         """Return raw flow/temperature counts + PQI (for debugging)."""
         pd = self._read_pdin_bytes()
         pqi = self._read_pqi()
         d = {"pqi": pqi, "len": len(pd), "byte_swap": self.byte_swap}
-        d["flow_raw"] = struct.unpack(">h", pd[4:6])[0] if len(pd) >= 6 else None
-        d["temp_raw"] = struct.unpack(">h", pd[6:8])[0] if len(pd) >= 8 else None
+        d["flow_raw"] = _INT16_BE.unpack_from(pd, 4)[0] if len(pd) >= 6 else None
+        d["temp_raw"] = _INT16_BE.unpack_from(pd, 6)[0] if len(pd) >= 8 else None
         return d
 
     def monitor(self, duration=None, callback=None, stop_event=None, interval=0.5, debug=False):
@@ -140,7 +142,12 @@ class FlowSensorSD6020:
                     break
                 if duration and (time.time() - start) >= duration:
                     break
-                time.sleep(interval)
+                if stop_event:
+                    # Wake as soon as the caller asks us to stop.
+                    if stop_event.wait(interval):
+                        break
+                else:
+                    time.sleep(interval)
         except KeyboardInterrupt:
             pass
 
@@ -77,6 +77,11 @@ class LoadCellLCM300:
                     break
                 if duration is not None and (time.time() - start) >= duration:
                     break
-                time.sleep(interval)
+                if stop_event is not None:
+                    # Wake as soon as the caller asks us to stop.
+                    if stop_event.wait(interval):
+                        break
+                else:
+                    time.sleep(interval)
         except KeyboardInterrupt:
             pass
@@ -65,6 +65,11 @@ class PressureSensorPQ3834:
                     break
                 if duration is not None and (time.time() - start) >= duration:
                     break
-                time.sleep(interval)
+                if stop_event is not None:
+                    # Wake as soon as the caller asks us to stop.
+                    if stop_event.wait(interval):
+                        break
+                else:
+                    time.sleep(interval)
         except KeyboardInterrupt:
             pass